@@ -1,5 +1,8 @@
 from __future__ import annotations
 import unittest
+from collections.abc import Sequence
+
+from tupleclass import TupleClass
 
 class TestTupleClass(unittest.TestCase):
     def _make_dummy_TupleClass(self) -> type:
@@ -12,18 +15,52 @@ class TestTupleClass(unittest.TestCase):
     def test_tuple_behavior(self):
         Dummy = self._make_dummy_TupleClass()
             
-        # a Dummy is a subclass of tuple (not really, but python thinks so)
-        assert issubclass(Dummy, tuple)
+        # a Dummy is a sequence, like a tuple
+        assert issubclass(Dummy, Sequence)
         
-        # a Dummy is a tuple
+        # a Dummy behaves as a tuple
         d = Dummy(10,'hi')
-        assert isinstance(d, tuple)
+        assert isinstance(d, Sequence)
         assert isinstance(d, Dummy)
         assert d[0] == 10
         assert d[1] == 'hi'
+        assert d[-1] == 'hi'
+        assert d[:1] == (10,)
+        assert d[::-1] == ('hi', 10)
         assert d == (10, 'hi')
         assert list(d) == [10, 'hi']
         assert len(d) == 2
+        assert list(reversed(d)) == ['hi', 10]
+        assert 'hi' in d
+        assert d.count(10) == 1
+        assert d.index('hi') == 1
+
+    def test_ordering(self):
+        Dummy = self._make_dummy_TupleClass()
+
+        d = Dummy(10)
+        assert d != (10, 'hi')
+        assert not d != (10, 'default')
+        assert d < (11, 'a')
+        assert d <= (10, 'default')
+        assert d > (10, 'abc')
+        assert d >= (9, 'z')
+        assert Dummy(1, 'a') < Dummy(1, 'b')
+        assert d != 10
+        assert d < (10, 'default', 0)
+
+    def test_inherited_comparison(self):
+        class P(TupleClass):
+            k: int
+
+            def __eq__(self, other):
+                return self.k == other.k
+
+        class Q(P):
+            v: int
+
+        assert Q(1, 5) == Q(1, 6)
+        assert Q(1, 5) < Q(1, 6)
 
     def test_named_tuple_behavior(self):
         Dummy = self._make_dummy_TupleClass() 
@@ -41,6 +78,47 @@ class TestTupleClass(unittest.TestCase):
         assert Dummy(x=10) == (10, 'default')
         assert Dummy(10,y='hi') == (10, 'hi')
 
+    def test_constructor_arguments(self):
+        Dummy = self._make_dummy_TupleClass()
+
+        with self.assertRaises(TypeError):
+            Dummy(1, 2, 3)
+        with self.assertRaises(TypeError):
+            Dummy(z=1)
+
+    def test_inherited_init(self):
+        class Init(TupleClass):
+            p: int
+            q: str = 'q'
+
+            def __init__(self, p):
+                self.p = p * 2
+
+        class Init2(Init):
+            pass
+
+        assert Init(1).p == 2
+        assert Init2(1).p == 2
+
+        # defaults still apply under a user __init__, inherited or not
+        assert list(Init(1)) == [2, 'q']
+        assert str(Init(1)) == "Init(2, 'q')"
+        assert list(Init2(1)) == [2, 'q']
+        assert str(Init2(1)) == "Init2(2, 'q')"
+
+    def test_user_init_defaults(self):
+        class U(TupleClass):
+            a: int
+            b: int = 7
+
+            def __init__(self, a):
+                self.a = a
+
+        u = U(1)
+        assert list(u) == [1, 7]
+        assert str(u) == 'U(1, 7)'
+        assert u == (1, 7)
+
     def test_mutability(self):
         d = self._make_dummy_TupleClass()(10,'hi')
 
@@ -58,6 +136,33 @@ class TestTupleClass(unittest.TestCase):
         assert b.a == 'a'
         assert b.b == 'b'
 
+    def test_inheritance_default_override(self):
+        class A(TupleClass):
+            a: str = 'a'
+
+        class C(A):
+            a = 'override'
+
+        assert C().a == 'override'
+        assert A().a == 'a'
+
+    def test_slots(self):
+        d = self._make_dummy_TupleClass()(10, 'hi')
+        assert not hasattr(d, '__dict__')
+        with self.assertRaises(AttributeError):
+            d.z = 1
+
+        class A(TupleClass):
+            a: str
+
+        class B(TupleClass):
+            b: str
+
+        # both bases lay out their own slots
+        with self.assertRaises(TypeError):
+            class AB(A, B):
+                pass
+
     def test_inheritance_no_defaults_a(self):
         class A(TupleClass):
             a: str
@@ -8,97 +8,234 @@ Alternative names: FieldTuple, Field, Mutple
 
 from __future__ import annotations
 from typing import Any
-from collections.abc import Mapping
-from dataclasses import dataclass, field, fields, MISSING, make_dataclass
-import functools
-import io
+from collections.abc import Callable, Iterator, Sequence
+import itertools
+import linecache
+import operator
+import sys
+import weakref
+
+_filename_counter = itertools.count()
+
+def _generated_filename(cls: type, method: str) -> str:
+    """A unique pseudo-filename for source generated for `cls`, so tracebacks
+    through generated methods can show their source via linecache."""
+    return f"<tupleclass generated {method} {cls.__module__}.{cls.__qualname__}-{next(_filename_counter)}>"
+
+def _compile_methods(cls: type, label: str, src: str, globs: dict[str, Any]) -> dict[str, Any]:
+    """Compile the generated `src` defining methods of `cls`, registering it
+    with linecache under a unique pseudo-filename."""
+    filename = _generated_filename(cls, label)
+    locs: dict[str, Any] = {}
+    exec(compile(src, filename, 'exec'), globs, locs)
+    linecache.cache[filename] = (len(src), None, src.splitlines(True), filename)
+    weakref.finalize(cls, linecache.cache.pop, filename, None)
+
+    for method in locs.values():
+        method.__qualname__ = f'{cls.__qualname__}.{method.__name__}'
+        method.__tupleclass_generated__ = True
+    return locs
+
+def _replaceable(cls: type, method: str) -> bool:
+    """Whether a generated `method` may be installed on `cls`, i.e. the one it
+    would otherwise use is object's or was itself generated, rather than one
+    written by the user in its body or a parent's."""
+    existing = getattr(cls, method)
+    return existing is getattr(object, method) or getattr(existing, '__tupleclass_generated__', False)
+
+def _make_init(cls: type, field_names: tuple[str, ...], defaults: dict[str, Any]) -> Callable[..., None]:
+    """Generate an __init__ for `cls` with one keyword-capable parameter per
+    field, in order, defaulting to its entry in `defaults` (or None)."""
+    self_name = '__tupleclass_self__' if 'self' in field_names else 'self'
+    globs: dict[str, Any] = {}
+    params: list[str] = [self_name]
+    lines: list[str] = []
+    for name in field_names:
+        globs[f'_dflt_{name}'] = defaults.get(name)
+        params.append(f'{name}=_dflt_{name}')
+        lines.append(f'    {self_name}.{name} = {name}')
+    src = f"def __init__({', '.join(params)}):\n" + ('\n'.join(lines) or '    pass') + '\n'
+
+    return _compile_methods(cls, '__init__', src, globs)['__init__']
+
+def _make_new(cls: type, field_names: tuple[str, ...], defaults: dict[str, Any]) -> Callable[..., Any]:
+    """Generate a __new__ for `cls` that fills every field with its entry in
+    `defaults` (or None), for classes whose __init__ is user-written and so
+    can't rely on the generated __init__ to apply them."""
+    lines = [
+        "def __new__(cls, *args, **kwargs):",
+        "    instance = _object_new(cls)",
+    ]
+    globs: dict[str, Any] = {'_object_new': object.__new__}
+    for name in field_names:
+        globs[f'_dflt_{name}'] = defaults.get(name)
+        lines.append(f"    instance.{name} = _dflt_{name}")
+    lines.append("    return instance")
+    src = '\n'.join(lines) + '\n'
+
+    return _compile_methods(cls, '__new__', src, globs)['__new__']
+
+_ORDERINGS = {'__lt__': '<', '__le__': '<=', '__gt__': '>', '__ge__': '>='}
+
+# how every generated comparison vets `other`: another TupleClass is snapshot
+# into a tuple up front, and concrete sequence types are let through before
+# falling back to the much slower Sequence ABC check
+_OTHER_CHECK = (
+    "    if type(other) is not tuple and not isinstance(other, (tuple, list)):",
+    "        if isinstance(type(other), _TupleClassMeta):",
+    "            other = type(other).__tupleclass_astuple__(other)",
+    "        elif not isinstance(other, _Sequence):",
+    "            return NotImplemented",
+)
+
+def _make_comparisons(cls: type, field_names: tuple[str, ...]) -> dict[str, Callable[[Any, Any], Any]]:
+    """Generate __eq__ and the ordering methods for `cls`, comparing field by
+    field against any sequence with the same semantics as tuple comparison,
+    without building a tuple of either side."""
+    self_name = '__tupleclass_self__' if 'self' in field_names else 'self'
+    size = len(field_names)
+
+    lines = [
+        f"def __eq__({self_name}, other):",
+        *_OTHER_CHECK,
+        f"    if len(other) != {size}:",
+        "        return False",
+    ]
+    for i, name in enumerate(field_names):
+        lines += [
+            f"    a = {self_name}.{name}",
+            f"    b = other[{i}]",
+            "    if not (a is b or a == b):",
+            "        return False",
+        ]
+    lines.append("    return True")
+
+    # lexicographic, the first differing field decides, otherwise the lengths
+    for method, op in _ORDERINGS.items():
+        lines += [
+            f"def {method}({self_name}, other):",
+            *_OTHER_CHECK,
+            "    n = len(other)",
+        ]
+        for i, name in enumerate(field_names):
+            lines += [
+                f"    if n == {i}:",
+                f"        return {size} {op} n",
+                f"    a = {self_name}.{name}",
+                f"    b = other[{i}]",
+                "    if not (a is b or a == b):",
+                f"        return a {op} b",
+            ]
+        lines.append(f"    return {size} {op} n")
+    src = '\n'.join(lines) + '\n'
+
+    return _compile_methods(cls, 'comparisons', src, {'_Sequence': Sequence, '_TupleClassMeta': _TupleClassMeta})
+
+def _make_astuple(field_names: tuple[str, ...]) -> Callable[[Any], tuple[Any, ...]]:
+    """A callable returning the field values of an instance as a real tuple.
+
+    attrgetter fetches every field in a single C call, but only returns a
+    tuple when given more than one name."""
+    if len(field_names) > 1:
+        return operator.attrgetter(*field_names)
+    if field_names:
+        return lambda self, _name=field_names[0]: (getattr(self, _name),)
+    return lambda self: ()
 
 class _TupleClassMeta(type):
     """The metaclass of TupleClass (see below for TupleClass)"""
-    def __new__(cls, name, bases, dct):
-        annotations = dct.get('__annotations__', {})
-        new_cls = make_dataclass(name, [(name, typ, field(default=MISSING)) for name, typ in annotations.items()], bases=bases) # pass tuple superclass in here in bases
-        new_cls.__module__ = dct.get('__module__')
-        for key, value in dct.items():
-            if key != '__annotations__':
-                setattr(new_cls, key, value)
-
-        # don't actually use the tuple superclass's __new__
-        # TODO if superclass is a subclass of TupleClass, then make smart 
-        # constructor chain
-        original_new = new_cls.__new__
-        def __new__(cls, *args, **kwargs):
-            instance = original_new(cls, tuple(args)) # convert args to tuple
-            for name, value in zip([f.name for f in fields(cls)], args):
-                setattr(instance, name, value)
-            for name, value in kwargs.items():
-                setattr(instance, name, value)
-            return instance
-        setattr(new_cls, '__new__', __new__)
-
-        # add an __iter__ method to enable emulated tuple unpacking
-        def __iter__(self):
-            field_names = list(self.__annotations__.keys())
-            for f in field_names:
-                yield getattr(self, f)
-        setattr(new_cls, '__iter__', __iter__)
-
-        # pseudo-tuple index access
-        def __getitem__(self, key: int) -> Any:
-            return getattr(self, list(self.__annotations__.keys())[key])
-        setattr(new_cls, '__getitem__', __getitem__)
-
-        # pseudo-tuple index set
-        def __setitem__(self, key: int, val: Any):
-            setattr(self, list(self.__annotations__.keys())[key], val)
-        setattr(new_cls, '__setitem__', __setitem__)
-
-        # pretty tuple print
-        def __str__(self):
-            return self.__class__.__name__ + str(tuple(self))
-        setattr(new_cls, '__str__', __str__)        
+    def __new__(cls, name: str, bases: tuple[type, ...], dct: dict[str, Any]) -> _TupleClassMeta:
+        annotations: dict[str, Any] = dct.get('__annotations__', {})
+
+        # fields are stored in slots, so their defaults can't stay in the class
+        # body, they are kept aside and only used by the generated __init__
+        # a plain assignment to an inherited field also overrides its default
+        inherited_fields = {key for base in bases for key in getattr(base, '__tupleclass_fields__', ())}
+        namespace = {key: value for key, value in dct.items() if key not in annotations and key not in inherited_fields}
+        namespace.setdefault('__slots__', tuple(key for key in annotations if key not in inherited_fields))
+        new_cls = super().__new__(cls, name, bases, namespace)
+
+        # merge the annotations and defaults of every TupleClass in the MRO,
+        # inherited first, the fields are fixed once the class is created
+        merged_annotations: dict[str, Any] = {}
+        merged_defaults: dict[str, Any] = {}
+        for base in reversed(new_cls.__mro__[1:]):
+            if isinstance(base, _TupleClassMeta):
+                merged_annotations.update(base.__dict__.get('__annotations__', {}))
+                merged_defaults.update(base.__tupleclass_defaults__)
+        merged_annotations.update(annotations)
+        merged_defaults.update((key, dct[key]) for key in (*inherited_fields, *annotations) if key in dct)
+        new_cls.__tupleclass_annotations__ = merged_annotations
+        field_names: tuple[str, ...] = tuple(sys.intern(key) for key in merged_annotations)
+        new_cls.__tupleclass_fields__ = field_names
+        new_cls.__match_args__ = field_names
+
+        # only explicitly defaulted fields are kept, the rest start out as None
+        defaults: dict[str, Any] = {name: merged_defaults[name] for name in field_names if name in merged_defaults}
+        new_cls.__tupleclass_defaults__ = defaults
+        new_cls.__tupleclass_astuple__ = staticmethod(_make_astuple(field_names))
+
+        # a single specialised __init__ assigns every field exactly once
+        if _replaceable(new_cls, '__init__'):
+            setattr(new_cls, '__init__', _make_init(new_cls, field_names, defaults))
+        elif _replaceable(new_cls, '__new__'):
+            # a user __init__ doesn't apply defaults, so fill them in beforehand
+            setattr(new_cls, '__new__', _make_new(new_cls, field_names, defaults))
+
+        # tuple equivalence and ordering, unrolled over the fields
+        for method, func in _make_comparisons(new_cls, field_names).items():
+            if _replaceable(new_cls, method):
+                setattr(new_cls, method, func)
 
         # TODO: __repr__ that prints also the field names
 
         return new_cls
 
-@functools.total_ordering
-class TupleClass(tuple, metaclass=_TupleClassMeta):
+class TupleClass(metaclass=_TupleClassMeta):
     """Mutable Named pseudo-Tuple.
 
-    Acts just like a regular NamedTuple and thus a normal tuple, but, is really a subclass of a dataclass instance. 
+    Acts just like a regular NamedTuple and thus a normal tuple, but, is really a slotted class with one slot per field. 
+    It is not a tuple subclass, instead it is registered as a collections.abc.Sequence.
 
     Requires each specified field to be typed, since in Python, we can only determine dynamic fields via typed __annotations__.
     """
 
-    def __init__(self, *args, **kwargs):
-        # store all annotation names in their defined order
-        field_names = []
+    # add an __iter__ method to enable emulated tuple unpacking
+    def __iter__(self) -> Iterator[Any]:
+        return iter(type(self).__tupleclass_astuple__(self))
 
-        # check for inherited annotations
-        for base in self.__class__.__mro__[1:-3]:
-            field_names.extend(list(base.__annotations__.keys()))
+    # membership and reversal also go through the snapshot, rather than the
+    # fallbacks via __iter__ and __getitem__
+    def __contains__(self, value: Any) -> bool:
+        return value in type(self).__tupleclass_astuple__(self)
 
-        # add all annotations defined in this class only
-        field_names.extend(list(self.__annotations__.keys()))
-        if len(args) > len(field_names):
-            raise TypeError(f"Expected at most {len(field_names)} arguments, got {len(args)}")
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(type(self).__tupleclass_astuple__(self))
 
-        # set all default
-        for name in field_names:
-            if not hasattr(self, name): # perhaps a default was already provided
-                setattr(self, name, None)
+    # pseudo-tuple index access
+    def __getitem__(self, key: int | slice) -> Any:
+        if isinstance(key, slice):
+            return type(self).__tupleclass_astuple__(self)[key]
+        return getattr(self, type(self).__tupleclass_fields__[key])
 
-        for name, value in zip(field_names, args):
-            setattr(self, name, value)
-        for name, value in kwargs.items():
-            setattr(self, name, value)
+    # pseudo-tuple index set
+    def __setitem__(self, key: int, val: Any) -> None:
+        setattr(self, type(self).__tupleclass_fields__[key], val)
 
-        setattr(self, '__TupleClass_field_names', field_names)
+    # pretty tuple print
+    def __str__(self) -> str:
+        return f"{type(self).__name__}{type(self).__tupleclass_astuple__(self)!r}"
 
-    # allow tuple equivalence w/ total_ordering
-    def __eq__(self, other):
-        return tuple(self) == tuple(other)
+    def __len__(self) -> int:
+        return len(type(self).__tupleclass_fields__)
 
-    def __lt__(self, other):
-        return tuple(self) < tuple(other)
\ No newline at end of file
+    def count(self, value: Any) -> int:
+        return type(self).__tupleclass_astuple__(self).count(value)
+
+    def index(self, value: Any, *args: int) -> int:
+        return type(self).__tupleclass_astuple__(self).index(value, *args)
+
+    # mutable, so not hashable
+    __hash__ = None
+
+Sequence.register(TupleClass)